@@ -1,10 +1,15 @@
-from typing import Dict, Any, Optional, List, Union
+from itertools import islice
+from typing import Dict, Any, Optional, List, Union, Iterable
+
+_MAX_MENTIONS = 100
 
 class DiscordAllowedMentions:
     """
     A class for handling allowed mentions in Discord messages.
     """
 
+    __slots__ = ("parse", "users", "roles")
+
     def __init__(self, parse: Optional[List[str]] = None, users: Optional[List[str]] = None,
                  roles: Optional[List[str]] = None, replied_user: Optional[bool] = None) -> None:
         """
@@ -66,6 +71,32 @@ class DiscordAllowedMentions:
             self.roles = []
         self.roles.append(str(role_id))
 
+    def add_users(self, user_ids: Iterable[int]) -> None:
+        """
+        Add several users to be mentioned.
+
+        Discord accepts at most 100 users, so IDs past that limit are not converted or stored.
+
+        Parameters:
+            user_ids (Iterable[int]): The IDs of the users to mention.
+        """
+        if not self.users:
+            self.users = []
+        self.users.extend(map(str, islice(user_ids, max(_MAX_MENTIONS - len(self.users), 0))))
+
+    def add_roles(self, role_ids: Iterable[int]) -> None:
+        """
+        Add several roles to be mentioned.
+
+        Discord accepts at most 100 roles, so IDs past that limit are not converted or stored.
+
+        Parameters:
+            role_ids (Iterable[int]): The IDs of the roles to mention.
+        """
+        if not self.roles:
+            self.roles = []
+        self.roles.extend(map(str, islice(role_ids, max(_MAX_MENTIONS - len(self.roles), 0))))
+
     def to_dict(self) -> Dict[str, Union[bool, Dict[str, List[str]]]]:
         """
         Convert the allowed mentions object to a dictionary.
@@ -79,9 +110,9 @@ class DiscordAllowedMentions:
             mentions_dict["parse"] = self.parse
 
         if self.users:
-            mentions_dict["users"] = self.users[100:]
+            mentions_dict["users"] = self.users[:_MAX_MENTIONS]
 
         if self.roles:
-            mentions_dict["roles"] = self.roles[100:]
+            mentions_dict["roles"] = self.roles[:_MAX_MENTIONS]
 
         return mentions_dict
\ No newline at end of file
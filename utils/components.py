@@ -1,11 +1,15 @@
 from typing import Optional, Dict, List, Any, Union
 from datetime import datetime
 
+_MAX_BUTTONS_PER_ROW = 5
+
 class DiscordComponents:
     """
     A class for creating Discord message components.
     """
 
+    __slots__ = ("components",)
+
     def __init__(self) -> None:
         """
         Initialize a Discord Components method.
@@ -25,6 +29,8 @@ class DiscordComponents:
         """
         Add a button component to an action row.
 
+        The button joins the last action row if it only holds buttons and has room, otherwise a new row is started.
+
         Parameters:
             label (str): Label text of the button.
             custom_id (str): Custom ID of the button.
@@ -39,11 +45,15 @@ class DiscordComponents:
         if url:
             button["url"] = url
 
-        self.components.append(button)
+        row = self.components[-1]["components"] if self.components else None
+        if row is None or len(row) >= _MAX_BUTTONS_PER_ROW or (row and row[0]["type"] != 2):
+            self.add_action_row([button])
+        else:
+            row.append(button)
 
     def add_select_menu(self, custom_id: str, options: List[Dict[str, Any]], placeholder: str, min_values: int = 1, max_values: int = 1, disabled: bool = False) -> None:
         """
-        Add a select menu component to an action row.
+        Add a select menu component in its own action row.
 
         Parameters:
             custom_id (str): Custom ID of the select menu.
@@ -63,7 +73,7 @@ class DiscordComponents:
             "disabled": disabled
         }
 
-        self.components.append(select_menu)
+        self.add_action_row([select_menu])
 
     def get_components(self) -> List[Dict[str, Any]]:
         """
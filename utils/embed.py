@@ -1,11 +1,60 @@
+from functools import lru_cache
 from typing import Optional, Dict, List, Any, Union
-from datetime import datetime
+from datetime import datetime, timezone
+from utils.utilities import _color_to_int
+
+# Serialized embed keys in output order, paired with the slot holding each value.
+_EMBED_KEYS = tuple((key, "_" + key) for key in ("title", "description", "url", "timestamp", "color", "footer",
+                                                 "image", "thumbnail", "video", "provider", "author", "fields"))
+
+def _embed_attribute(name: str) -> property:
+    slot = "_" + name
+
+    def getter(self: "DiscordEmbed") -> Any:
+        return getattr(self, slot)
+
+    def setter(self: "DiscordEmbed", value: Any) -> None:
+        setattr(self, slot, value)
+        self._dirty = True
+
+    return property(getter, setter)
+
+@lru_cache(maxsize=256)
+def _parse_iso_timestamp(timestamp: str) -> str:
+    return datetime.fromisoformat(timestamp).isoformat()
+
+def _validate_field(field: Dict[str, Any]) -> None:
+    if "name" not in field or "value" not in field:
+        raise ValueError("Each field must have 'name' and 'value' keys.")
+    if not isinstance(field["name"], str) or not isinstance(field["value"], str):
+        raise ValueError("The 'name' and 'value' of each field must be strings.")
+    if "inline" in field and not isinstance(field["inline"], bool):
+        raise ValueError("The 'inline' key, if present, must be a boolean.")
+
+def _validate_fields(fields: List[Dict[str, Any]]) -> None:
+    for field in fields:
+        _validate_field(field)
 
 class DiscordEmbed:
     """
     A class for creating Discord Embeds.
     """
 
+    __slots__ = ("_title", "_description", "_url", "_footer", "_image", "_thumbnail", "_video",
+                 "_provider", "_author", "_fields", "_color", "_timestamp", "_dirty", "_cached")
+
+    title = _embed_attribute("title")
+    description = _embed_attribute("description")
+    url = _embed_attribute("url")
+    timestamp = _embed_attribute("timestamp")
+    color = _embed_attribute("color")
+    footer = _embed_attribute("footer")
+    image = _embed_attribute("image")
+    thumbnail = _embed_attribute("thumbnail")
+    video = _embed_attribute("video")
+    provider = _embed_attribute("provider")
+    author = _embed_attribute("author")
+
     def __init__(self, 
                  title: Optional[str] = None, 
                  description: Optional[str] = None, 
@@ -28,21 +77,39 @@ class DiscordEmbed:
                 - url (str): URL making the title a clickable link.
                 - video (Dict[str, Any]): Video details.
         """
-        self.title = title
-        self.description = description
-        self.url = kwargs.get("url")
-        self.footer = kwargs.get("footer")
-        self.image = kwargs.get("image")
-        self.thumbnail = kwargs.get("thumbnail")
-        self.video = kwargs.get("video")
-        self.provider = kwargs.get("provider")
-        self.author = kwargs.get("author")
-        self.fields = kwargs.get("fields", [])
-        self.color = None
-        self.timestamp = None
+        self._title = title
+        self._description = description
+        self._url = None
+        self._footer = None
+        self._image = None
+        self._thumbnail = None
+        self._video = None
+        self._provider = None
+        self._author = None
+        self._fields = []
+        self._color = None
+        self._dirty = True
+        self._cached = None
+
+        if kwargs:
+            self._apply_kwargs(kwargs)
+        self.set_timestamp(kwargs.get("timestamp"))
+
+    def _apply_kwargs(self, kwargs: Dict[str, Any]) -> None:
+        self._url = kwargs.get("url")
+        self._footer = kwargs.get("footer")
+        self._image = kwargs.get("image")
+        self._thumbnail = kwargs.get("thumbnail")
+        self._video = kwargs.get("video")
+        self._provider = kwargs.get("provider")
+        self._author = kwargs.get("author")
+
+        fields = kwargs.get("fields")
+        if fields is not None:
+            _validate_fields(fields)
+            self._fields = fields
 
         self.set_color(kwargs.get("color"))
-        self.set_timestamp(kwargs.get("timestamp"))
 
     def set_title(self, title: str) -> None:
         """
@@ -79,12 +146,14 @@ class DiscordEmbed:
             timestamp (Optional[Union[float, int, str, datetime]]): The timestamp to set. If None, uses the current time.
         """
         if timestamp is None:
-            timestamp = datetime.utcnow()
+            self._timestamp = datetime.now(timezone.utc).isoformat()
         elif isinstance(timestamp, (float, int)):
-            timestamp = datetime.utcfromtimestamp(timestamp)
+            self._timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
         elif isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
-        self.timestamp = timestamp.isoformat()
+            self._timestamp = _parse_iso_timestamp(timestamp)
+        else:
+            self._timestamp = timestamp.isoformat()
+        self._dirty = True
 
     def set_color(self, color: Optional[Union[str, int]] = None) -> None:
         """
@@ -94,11 +163,7 @@ class DiscordEmbed:
             color (Optional[Union[str, int]]): The color of the embed in hexadecimal or decimal format.
         """
         if color is not None:
-            if isinstance(color, str):
-                color = int(color, 16)
-            if not (0 <= color < 16777216):
-                raise ValueError(f"Color {color} is out of the valid range.")
-            self.color = color
+            self.color = _color_to_int(color)
 
     def set_footer(self, text: str, icon_url: Optional[str] = None) -> None:
         """
@@ -172,8 +237,16 @@ class DiscordEmbed:
             name (str): Name of the field.
             value (str): Value of the field.
             inline (bool): Whether the field is inline with other fields. Default is True.
+
+        Raises:
+            ValueError: If the name or value is not a string, or inline is not a boolean.
         """
-        self.fields.append({"name": name, "value": value, "inline": inline})
+        if not isinstance(name, str) or not isinstance(value, str):
+            raise ValueError("The 'name' and 'value' of each field must be strings.")
+        if not isinstance(inline, bool):
+            raise ValueError("The 'inline' key, if present, must be a boolean.")
+        self._fields.append({"name": name, "value": value, "inline": inline})
+        self._dirty = True
 
     def remove_field(self, index: int) -> None:
         """
@@ -182,8 +255,9 @@ class DiscordEmbed:
         Parameters:
             index (int): Index of the field to remove.
         """
-        if 0 <= index < len(self.fields):
-            self.fields.pop(index)
+        if 0 <= index < len(self._fields):
+            self._fields.pop(index)
+            self._dirty = True
         else:
             raise IndexError("Field index out of range.")
 
@@ -194,27 +268,36 @@ class DiscordEmbed:
         Returns:
             List[Dict[str, Any]]: List of fields in the embed.
         """
-        return self.fields
+        return self._fields
+
+    @property
+    def fields(self) -> List[Dict[str, Any]]:
+        """
+        List[Dict[str, Any]]: List of fields in the embed. Assigned lists are validated like `add_field` arguments.
+        """
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields: List[Dict[str, Any]]) -> None:
+        _validate_fields(fields)
+        self._fields = fields
+        self._dirty = True
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the embed object to a dictionary.
 
+        The dictionary is cached and reused until the embed is modified, so treat it as read-only.
+
         Returns:
             Dict[str, Any]: Dictionary representation of the embed.
         """
-        embed = {
-            "title": self.title,
-            "description": self.description,
-            "url": self.url,
-            "timestamp": self.timestamp,
-            "color": self.color,
-            "footer": self.footer,
-            "image": self.image,
-            "thumbnail": self.thumbnail,
-            "video": self.video,
-            "provider": self.provider,
-            "author": self.author,
-            "fields": self.fields,
-        }
-        return {k: v for k, v in embed.items() if v is not None}
+        if self._dirty:
+            embed = {}
+            for key, slot in _EMBED_KEYS:
+                value = getattr(self, slot)
+                if value is not None:
+                    embed[key] = value
+            self._cached = embed
+            self._dirty = False
+        return self._cached
@@ -6,6 +6,8 @@ class DiscordPoll:
     A class for creating Discord polls.
     """
 
+    __slots__ = ("question", "options")
+
     def __init__(self, question: str, options: List[str]) -> None:
         """
         Initialize a Discord poll method.
@@ -1,11 +1,29 @@
+import time
+from functools import lru_cache
 from typing import Optional, Dict, List, Any, Union
-from datetime import datetime
+
+_COLOR_MAX = 1 << 24
+
+_VALID_TIMESTAMP_FORMATS = frozenset("RDdTtFf")
+
+@lru_cache(maxsize=128)
+def _format_timestamp(seconds: int, format: str) -> str:
+    return f"<t:{seconds}:{format}>"
+
+def _color_to_int(color: Union[str, int]) -> int:
+    if isinstance(color, str):
+        color = int(color, 16)
+    if not (0 <= color < _COLOR_MAX):
+        raise ValueError(f"Color {color} is out of the valid range.")
+    return color
 
 class DiscordUtilities:
     """
     A class for various Discord utility functions.
     """
 
+    __slots__ = ()
+
     def create_timestamp(self, format: str) -> str:
         """
         Create a Discord timestamp in a specified format.
@@ -26,12 +44,10 @@ class DiscordUtilities:
         Raises:
             ValueError: If an invalid format is provided.
         """
-        valid_formats = {"R", "D", "d", "T", "t", "F", "f"}
-        if format not in valid_formats:
-            raise ValueError(f"Invalid format '{format}'. Must be one of {valid_formats}.")
-        
-        timestamp = int(datetime.now().timestamp())
-        return f"<t:{timestamp}:{format}>"
+        if format not in _VALID_TIMESTAMP_FORMATS:
+            raise ValueError(f"Invalid format '{format}'. Must be one of {set(_VALID_TIMESTAMP_FORMATS)}.")
+
+        return _format_timestamp(int(time.time()), format)
 
     def convert_color_to_int(self, color: Union[str, int]) -> int:
         """
@@ -46,8 +62,4 @@ class DiscordUtilities:
         Raises:
             ValueError: If the color is out of the valid range.
         """
-        if isinstance(color, str):
-            color = int(color, 16)
-        if not (0 <= color < 16777216):
-            raise ValueError(f"Color {color} is out of the valid range.")
-        return color
\ No newline at end of file
+        return _color_to_int(color)
\ No newline at end of file
@@ -1,49 +1,91 @@
+import asyncio
+import atexit
+import logging
+import types
 import requests
-from typing import Dict, Any, Optional, List
-from utils.embed import DiscordEmbed
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Union
+from utils.embed import DiscordEmbed, _validate_fields
 from utils.components import DiscordComponents
 from utils.poll import DiscordPoll
 from utils.allowed_mentions import DiscordAllowedMentions
 
+_JSON_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+_MAX_EMBEDS = 10
+_MAX_QUEUED_EMBEDS = 100
+
+_log = logging.getLogger(__name__)
+
+# Every webhook talks to discord.com, so all instances share one connection pool.
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=200, pool_block=False))
+atexit.register(_SHARED_SESSION.close)
+
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 class DiscordWebhook:
     """
     A class to handle Discord webhook requests.
     """
 
-    def __init__(self, url: str) -> None:
+    __slots__ = ("id", "token", "webhook_url", "headers", "timeout", "batch_window", "parse", "users",
+                 "_queue", "_queue_loop", "_queue_worker", "_queue_error")
+
+    def __init__(self, url: str, timeout: float = 10.0, batch_window: float = 0.5) -> None:
         """
         Initialize the DiscordWebhook method.
 
         Parameters:
             url (str): The webhook URL.
+            timeout (float): Seconds to wait for Discord to respond before giving up. Default is 10.0.
+            batch_window (float): Seconds `queue_embed` waits for more embeds before sending a batch. Default is 0.5.
         """
         self.id, self.token = self._parse_webhook_url(url)
         
         self.webhook_url = f"https://discord.com/api/webhooks/{self.id}/{self.token}"
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        self.headers = _JSON_HEADERS
+        self.timeout = timeout
+        self.batch_window = batch_window
         
         self.parse = []
         self.users = []
 
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue_worker: Optional[asyncio.Task] = None
+        self._queue_error: Optional[Exception] = None
+
     def _parse_webhook_url(self, url: str):
-        parts = url.split("/")
+        parts = url.rsplit("/", 2)
         return parts[-2], parts[-1]
 
-    def _embed_to_dict(self, embed: DiscordEmbed) -> Dict[str, Any]:
+    def _embed_to_dict(self, embed: Union[DiscordEmbed, Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Convert a DiscordEmbed object to a dictionary.
+        Convert an embed to a dictionary.
+
+        DiscordEmbed objects validate their fields as they are added, so only plain dictionaries
+        are validated here.
 
         Parameters:
-            embed (DiscordEmbed): The DiscordEmbed object to convert.
+            embed (Union[DiscordEmbed, Dict[str, Any]]): The DiscordEmbed object or embed dictionary to convert.
 
         Returns:
             Dict[str, Any]: The embed as a dictionary.
         """
-        embed_dict = embed.to_dict()
-        self.validate_embed_fields(embed_dict.get('fields', []))
-        return embed_dict
+        if isinstance(embed, DiscordEmbed):
+            return embed.to_dict()
+
+        self.validate_embed_fields(embed.get('fields', []))
+        return embed
 
     def validate_embed_fields(self, fields: List[Dict[str, Any]]) -> None:
         """
@@ -55,15 +97,9 @@ class DiscordWebhook:
         Raises:
             ValueError: If any field is missing required keys or has invalid values.
         """
-        for field in fields:
-            if "name" not in field or "value" not in field:
-                raise ValueError("Each field must have 'name' and 'value' keys.")
-            if not isinstance(field["name"], str) or not isinstance(field["value"], str):
-                raise ValueError("The 'name' and 'value' of each field must be strings.")
-            if "inline" in field and not isinstance(field["inline"], bool):
-                raise ValueError("The 'inline' key, if present, must be a boolean.")
+        _validate_fields(fields)
 
-    def execute(self, content: Optional[str] = None, embeds: Optional[List[DiscordEmbed]] = None,
+    def execute(self, content: Optional[str] = None, embeds: Optional[List[Union[DiscordEmbed, Dict[str, Any]]]] = None,
                 components: Optional[DiscordComponents] = None, poll: Optional[DiscordPoll] = None,
                 username: Optional[str] = None, avatar_url: Optional[str] = None, tts: Optional[bool] = False,
                 allowed_mentions: Optional[DiscordAllowedMentions] = None, ) -> requests.Response:
@@ -75,45 +111,130 @@ class DiscordWebhook:
 
         Parameters:
             content (Optional[str]): The message content.
-            embeds (Optional[List[DiscordEmbed]]): A list of DiscordEmbed objects to include in the message.
+            embeds (Optional[List[Union[DiscordEmbed, Dict[str, Any]]]]): A list of DiscordEmbed objects or embed dictionaries to include in the message.
             *components (Optional[DiscordComponents]): Components to include in the message.
             poll (Optional[DiscordPoll]): Poll object to include in the message.
             username (Optional[str]): Override the default username of the webhook.
             avatar_url (Optional[str]): Override the default avatar_url of the webhook.
             tts (Optional[bool]): If true, this will be a TTS message.
+            allowed_mentions (Optional[DiscordAllowedMentions]): Controls which mentions in the message ping.
             wait (Optional[bool]): If true, returns a message else 204 No Content depending.    
 
         Returns:
             requests.Response: The response from the webhook request.
         """
+        payload: Dict[str, Any] = {}
+
+        if content is not None:
+            payload["content"] = content
         if embeds:
-            embeds = embeds[:10] 
-            embed_dicts = [self._embed_to_dict(embed) for embed in embeds]
-        else:
-            embed_dicts = []
-            
-        component_data = components.get_components() if components else []
-        poll_data = poll.to_dict() if poll else {}
-
-        payload = {
-            "content": content,
-            "embeds": embed_dicts,
-            "components": component_data,
-            "poll": poll_data,
-            "tts": tts,
-            #"wait": wait
-        }
-        
+            payload["embeds"] = [self._embed_to_dict(embed) for embed in embeds[:_MAX_EMBEDS]]
+        if components:
+            payload["components"] = components.get_components()
+        if poll:
+            payload["poll"] = poll.to_dict()
+        if tts:
+            payload["tts"] = tts
         if username:
             payload["username"] = username
         if avatar_url:
             payload["avatar_url"] = avatar_url
+        if allowed_mentions:
+            payload["allowed_mentions"] = allowed_mentions.to_dict()
 
-        
-        response = requests.post(self.webhook_url, json=payload, headers=self.headers)
+        response = _SHARED_SESSION.post(self.webhook_url, data=_dumps(payload), headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
         return response
 
+    async def execute_async(self, *args: Any, **kwargs: Any) -> requests.Response:
+        """
+        Send a message to the webhook without blocking the event loop.
+
+        Accepts the same parameters as `execute`. The request runs in a worker thread on the
+        shared pooled session, so several webhooks can be sent to concurrently with
+        `asyncio.gather`.
+
+        Returns:
+            requests.Response: The response from the webhook request.
+        """
+        return await asyncio.to_thread(self.execute, *args, **kwargs)
+
+    async def queue_embed(self, embed: Union[DiscordEmbed, Dict[str, Any]]) -> None:
+        """
+        Queue an embed to be sent together with other queued embeds.
+
+        A background task collects embeds queued within `batch_window` seconds of the first one and
+        sends them as a single message of up to 10 embeds. Waits if too many embeds are already queued.
+
+        Parameters:
+            embed (Union[DiscordEmbed, Dict[str, Any]]): The DiscordEmbed object or embed dictionary to queue.
+        """
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._queue_loop is not loop or self._queue_worker.done():
+            self._queue = asyncio.Queue(maxsize=_MAX_QUEUED_EMBEDS)
+            self._queue_loop = loop
+            self._queue_worker = loop.create_task(self._drain_queue(self._queue))
+        await self._queue.put(embed)
+
+    async def flush(self) -> None:
+        """
+        Wait until every queued embed has been sent.
+
+        Every failed batch is logged as it happens; the first failure since the last flush is also raised here.
+
+        Raises:
+            RuntimeError: If the background task stopped while embeds were still queued. Those embeds are discarded.
+            Exception: The first error raised while sending a batch since the last flush, if any batch failed.
+        """
+        queue = self._queue
+        if queue is not None and self._queue_loop is asyncio.get_running_loop() and not self._queue_worker.done():
+            join = asyncio.ensure_future(queue.join())
+            await asyncio.wait((join, self._queue_worker), return_when=asyncio.FIRST_COMPLETED)
+            join.cancel()
+
+        error, self._queue_error = self._queue_error, None
+        if queue is not None and (self._queue_loop is not asyncio.get_running_loop() or self._queue_worker.done()):
+            unsent = queue.qsize()
+            self._queue = None
+            self._queue_loop = None
+            if unsent:
+                raise RuntimeError(f"{unsent} queued embeds were not sent because the batching task stopped.") from error
+
+        if error is not None:
+            raise error
+
+    async def aclose(self) -> None:
+        """
+        Stop the background task started by `queue_embed`. Embeds that have not been sent yet are discarded.
+        """
+        worker, self._queue_worker = self._queue_worker, None
+        self._queue = None
+        self._queue_loop = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    async def _drain_queue(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < _MAX_EMBEDS - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < _MAX_EMBEDS and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self.execute_async(embeds=batch)
+            except Exception as error:
+                _log.warning("Failed to send a batch of %d queued embeds.", len(batch), exc_info=error)
+                if self._queue_error is None:
+                    self._queue_error = error
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
     def delete_webhook(self) -> requests.Response:
         """
         Delete an existing webhook.
@@ -122,7 +243,7 @@ class DiscordWebhook:
             requests.Response: The response from the webhook request.
         """
 
-        response = requests.delete(self.webhook_url, headers=self.headers)
+        response = _SHARED_SESSION.delete(self.webhook_url, headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
         return response
 
@@ -143,7 +264,7 @@ class DiscordWebhook:
         if avatar_url:
             payload["avatar"] = avatar_url
 
-        response = requests.patch(self.webhook_url, json=payload, headers=self.headers)
+        response = _SHARED_SESSION.patch(self.webhook_url, data=_dumps(payload), headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
         return response
 
@@ -154,6 +275,6 @@ class DiscordWebhook:
         Returns:
             requests.Response: The response from the webhook request.
         """
-        response = requests.get(self.webhook_url, headers=self.headers)
+        response = _SHARED_SESSION.get(self.webhook_url, headers=self.headers, timeout=self.timeout)
         response.raise_for_status()
         return response
\ No newline at end of file